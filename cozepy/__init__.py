@@ -48,6 +48,8 @@ from .chat import (
     MessageRole,
     MessageType,
     ToolOutput,
+    dump_messages,
+    load_messages,
 )
 from .config import (
     COZE_CN_BASE_URL,
@@ -149,6 +151,8 @@ __all__ = [
     "ChatEventType",
     "ChatEvent",
     "ToolOutput",
+    "dump_messages",
+    "load_messages",
     # conversations
     "Conversation",
     # files
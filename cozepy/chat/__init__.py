@@ -1,11 +1,12 @@
-import json
 import time
 from enum import Enum
 from typing import TYPE_CHECKING, AsyncIterator, Dict, List, Optional, Union, overload
 
+from pydantic import TypeAdapter, ValidationError
 from typing_extensions import Literal
 
 from cozepy.auth import Auth
+from cozepy.exception import CozeAPIError
 from cozepy.model import AsyncIteratorHTTPResponse, AsyncStream, CozeModel, IteratorHTTPResponse, Stream
 from cozepy.request import Requester
 from cozepy.util import remove_url_trailing_slash
@@ -128,6 +129,9 @@ class MessageObjectString(CozeModel):
         return MessageObjectString(type=MessageObjectStringType.AUDIO, file_id=file_id, file_url=file_url)
 
 
+_MESSAGE_OBJECT_STRING_LIST_ADAPTER = TypeAdapter(List[MessageObjectString])
+
+
 class Message(CozeModel):
     # The entity that sent this message.
     role: MessageRole
@@ -171,7 +175,7 @@ class Message(CozeModel):
         return Message(
             role=MessageRole.USER,
             type=MessageType.QUESTION,
-            content=json.dumps([obj.model_dump() for obj in objects]),
+            content=_MESSAGE_OBJECT_STRING_LIST_ADAPTER.dump_json(objects).decode("utf-8"),
             content_type=MessageContentType.OBJECT_STRING,
             meta_data=meta_data,
         )
@@ -187,6 +191,30 @@ class Message(CozeModel):
         )
 
 
+_MESSAGE_LIST_ADAPTER = TypeAdapter(List[Message])
+
+
+def dump_messages(messages: List[Message]) -> bytes:
+    """
+    Serialize a list of messages to JSON bytes, e.g. to persist or replay a chat history.
+    Prefer it over json.dumps([m.model_dump() for m in messages]), the list is encoded in one pass.
+
+    :param messages: the messages to serialize, None fields are omitted
+    :return: JSON array bytes
+    """
+    return _MESSAGE_LIST_ADAPTER.dump_json(messages, exclude_none=True)
+
+
+def load_messages(data: Union[str, bytes]) -> List[Message]:
+    """
+    Parse a JSON array of messages, e.g. the output of dump_messages.
+
+    :param data: JSON array str or bytes
+    :return: list of Message
+    """
+    return _MESSAGE_LIST_ADAPTER.validate_json(data)
+
+
 class ChatStatus(str, Enum):
     """
     The running status of the session
@@ -362,29 +390,44 @@ class ChatEvent(CozeModel):
     message: Optional[Message] = None
 
 
-def _chat_stream_handler(data: Dict, logid: str, is_async: bool = False) -> ChatEvent:
-    event = data["event"]
-    event_data = data["data"]  # type: str
-    if event == ChatEventType.DONE:
-        if is_async:
-            raise StopAsyncIteration
-        raise StopIteration
-    elif event == ChatEventType.ERROR:
-        raise Exception(f"error event: {event_data}")  # TODO: error struct format
-    elif event in [
+_CHAT_MESSAGE_EVENTS = frozenset(
+    e.value
+    for e in (
         ChatEventType.CONVERSATION_MESSAGE_DELTA,
         ChatEventType.CONVERSATION_MESSAGE_COMPLETED,
         ChatEventType.CONVERSATION_AUDIO_DELTA,
-    ]:
-        return ChatEvent(event=event, message=Message.model_validate_json(event_data))
-    elif event in [
+    )
+)
+_CHAT_CHAT_EVENTS = frozenset(
+    e.value
+    for e in (
         ChatEventType.CONVERSATION_CHAT_CREATED,
         ChatEventType.CONVERSATION_CHAT_IN_PROGRESS,
         ChatEventType.CONVERSATION_CHAT_COMPLETED,
         ChatEventType.CONVERSATION_CHAT_FAILED,
         ChatEventType.CONVERSATION_CHAT_REQUIRES_ACTION,
-    ]:
-        return ChatEvent(event=event, chat=Chat.model_validate_json(event_data))
+    )
+)
+
+
+def _chat_stream_handler(data: Dict, logid: str, is_async: bool = False) -> ChatEvent:
+    event = data["event"]
+    event_data = data["data"]  # type: str
+    # the event is whitelisted and the payload is validated, skip re-validating the ChatEvent wrapper
+    if event in _CHAT_MESSAGE_EVENTS:
+        return ChatEvent.model_construct(event=ChatEventType(event), message=Message.model_validate_json(event_data))
+    elif event in _CHAT_CHAT_EVENTS:
+        return ChatEvent.model_construct(event=ChatEventType(event), chat=Chat.model_validate_json(event_data))
+    elif event == ChatEventType.DONE.value:
+        if is_async:
+            raise StopAsyncIteration
+        raise StopIteration
+    elif event == ChatEventType.ERROR.value:
+        try:
+            error = ChatError.model_validate_json(event_data)
+        except ValidationError:
+            raise CozeAPIError(None, f"error event: {event_data}", logid) from None
+        raise CozeAPIError(error.code, error.msg, logid)
     else:
         raise ValueError(f"invalid chat.event: {event}, {data}")
 
@@ -600,7 +643,7 @@ class ChatClient(object):
         body = {
             "bot_id": bot_id,
             "user_id": user_id,
-            "additional_messages": [i.model_dump() for i in additional_messages] if additional_messages else [],
+            "additional_messages": additional_messages or [],
             "stream": stream,
             "custom_variables": custom_variables,
             "auto_save_history": auto_save_history,
@@ -677,7 +720,7 @@ class ChatClient(object):
             "chat_id": chat_id,
         }
         body = {
-            "tool_outputs": [i.model_dump() for i in tool_outputs],
+            "tool_outputs": tool_outputs,
             "stream": stream,
         }
 
@@ -871,7 +914,7 @@ class AsyncChatClient(object):
         body = {
             "bot_id": bot_id,
             "user_id": user_id,
-            "additional_messages": [i.model_dump() for i in additional_messages] if additional_messages else [],
+            "additional_messages": additional_messages or [],
             "stream": stream,
             "custom_variables": custom_variables,
             "auto_save_history": auto_save_history,
@@ -987,7 +1030,7 @@ class AsyncChatClient(object):
             "chat_id": chat_id,
         }
         body = {
-            "tool_outputs": [i.model_dump() for i in tool_outputs],
+            "tool_outputs": tool_outputs,
             "stream": stream,
         }
 
@@ -39,7 +39,7 @@ class ConversationsClient(object):
         """
         url = f"{self._base_url}/v1/conversation/create"
         body = {
-            "messages": [i.model_dump() for i in messages] if messages and len(messages) > 0 else [],
+            "messages": messages or [],
             "meta_data": meta_data,
         }
         return self._requester.request("post", url, False, Conversation, body=body)
@@ -93,7 +93,7 @@ class AsyncConversationsClient(object):
         """
         url = f"{self._base_url}/v1/conversation/create"
         body = {
-            "messages": [i.model_dump() for i in messages] if messages and len(messages) > 0 else [],
+            "messages": messages or [],
             "meta_data": meta_data,
         }
         return await self._requester.arequest("post", url, False, Conversation, body=body)
@@ -299,8 +299,8 @@ class DocumentsClient(object):
         headers = {"Agw-Js-Conv": "str"}
         body = {
             "dataset_id": dataset_id,
-            "document_bases": [i.model_dump() for i in document_bases],
-            "chunk_strategy": chunk_strategy.model_dump() if chunk_strategy else None,
+            "document_bases": document_bases,
+            "chunk_strategy": chunk_strategy,
         }
         return self._requester.request(
             "post", url, False, [Document], headers=headers, body=body, data_field="document_infos"
@@ -449,8 +449,8 @@ class AsyncDocumentsClient(object):
         headers = {"Agw-Js-Conv": "str"}
         body = {
             "dataset_id": dataset_id,
-            "document_bases": [i.model_dump() for i in document_bases],
-            "chunk_strategy": chunk_strategy.model_dump() if chunk_strategy else None,
+            "document_bases": document_bases,
+            "chunk_strategy": chunk_strategy,
         }
         return await self._requester.arequest(
             "post", url, False, [Document], headers=headers, body=body, data_field="document_infos"
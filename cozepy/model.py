@@ -16,6 +16,7 @@ from typing import (
 )
 
 import httpx
+import pydantic_core
 from pydantic import BaseModel, ConfigDict
 
 from cozepy.exception import CozeInvalidEventError
@@ -80,22 +81,31 @@ class HTTPRequest(CozeModel, Generic[T]):
 
     @property
     def as_httpx(self) -> httpx.Request:
-        if self.files and self.json_body:
+        if self.files:
             return httpx.Request(
                 method=self.method,
                 url=self.url,
                 params=self.params,
                 headers=self.headers,
-                data=self.json_body,
+                data=self.json_body or None,
                 files=self.files,
             )
+        if self.json_body is None:
+            return httpx.Request(
+                method=self.method,
+                url=self.url,
+                params=self.params,
+                headers=self.headers,
+            )
+        # encode the body in pydantic-core once, instead of letting httpx json.dumps it
+        headers = httpx.Headers(self.headers)
+        headers.setdefault("Content-Type", "application/json")
         return httpx.Request(
             method=self.method,
             url=self.url,
             params=self.params,
-            headers=self.headers,
-            json=self.json_body,
-            files=self.files,
+            headers=headers,
+            content=pydantic_core.to_json(self.json_body),
         )
 
 
@@ -478,7 +488,7 @@ class Stream(Generic[T]):
         return self._handler(self._extra_event(), self._logid)
 
     def _extra_event(self) -> Dict[str, str]:
-        data = dict(map(lambda x: (x, ""), self._fields))
+        data = dict.fromkeys(self._fields, "")
         times = 0
 
         while times < len(data):
@@ -494,12 +504,12 @@ class Stream(Generic[T]):
         return data
 
     def _extra_field_data(self, line: str, data: Dict[str, str]) -> Tuple[str, str]:
-        for field in self._fields:
-            if line.startswith(field + ":"):
-                if data[field] == "":
-                    return field, line[len(field) + 1 :].strip()
-                else:
-                    raise CozeInvalidEventError(field, line, self._logid)
+        field, sep, value = line.partition(":")
+        if sep and field in data:
+            if data[field] == "":
+                return field, value.strip()
+            else:
+                raise CozeInvalidEventError(field, line, self._logid)
         raise CozeInvalidEventError("", line, self._logid)
 
 
@@ -548,13 +558,13 @@ class AsyncStream(Generic[T]):
                 times = 0
 
     def _extra_field_data(self, line: str, data: Dict[str, str]) -> Tuple[str, str]:
-        for field in self._fields:
-            if line.startswith(field + ":"):
-                if data[field] == "":
-                    return field, line[len(field) + 1 :].strip()
-                else:
-                    raise CozeInvalidEventError(field, line, self._logid)
+        field, sep, value = line.partition(":")
+        if sep and field in data:
+            if data[field] == "":
+                return field, value.strip()
+            else:
+                raise CozeInvalidEventError(field, line, self._logid)
         raise CozeInvalidEventError("", line, self._logid)
 
     def _make_data(self):
-        return dict(map(lambda x: (x, ""), self._fields))
+        return dict.fromkeys(self._fields, "")
@@ -11,6 +11,7 @@ from typing import (
 )
 
 import httpx
+import pydantic_core
 from httpx import Response
 from pydantic import BaseModel
 from typing_extensions import Literal
@@ -27,6 +28,18 @@ if TYPE_CHECKING:
 T = TypeVar("T", bound=BaseModel)
 
 
+class _LogJSONBody(object):
+    """
+    Encode the request body only when the debug log line is actually emitted.
+    """
+
+    def __init__(self, body: dict):
+        self._body = body
+
+    def __str__(self) -> str:
+        return pydantic_core.to_json(self._body).decode("utf-8")
+
+
 class SyncHTTPClient(httpx.Client):
     def __init__(self, **kwargs):
         kwargs.setdefault("timeout", DEFAULT_TIMEOUT)
@@ -82,7 +95,7 @@ class Requester(object):
             method,
             url,
             params,
-            json,
+            _LogJSONBody(json) if json is not None else None,
             stream,
             is_async,
         )
@@ -412,7 +425,7 @@ class Requester(object):
     ) -> Tuple[Optional[int], str, Any]:
         try:
             response.read()
-            body = response.json()
+            body = pydantic_core.from_json(response.content)
             logid = response.headers.get("x-tt-logid")
             log_debug("request %s#%s responding, logid=%s, data=%s", method, url, logid, body)
         except Exception as e:  # noqa: E722
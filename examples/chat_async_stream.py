@@ -0,0 +1,62 @@
+"""
+This example is about how to use the async client to run several streaming chat
+requests concurrently and handle their chat events
+"""
+
+import asyncio
+import os
+
+from cozepy import COZE_COM_BASE_URL
+
+# Get an access_token through personal access token or oauth.
+coze_api_token = os.getenv("COZE_API_TOKEN")
+# The default access is api.coze.com, but if you need to access api.coze.cn,
+# please use base_url to configure the api endpoint to access
+coze_api_base = os.getenv("COZE_API_BASE") or COZE_COM_BASE_URL
+
+from cozepy import AsyncCoze, TokenAuth, Message, ChatEventType  # noqa
+
+# Init the async Coze client through the access_token.
+coze = AsyncCoze(auth=TokenAuth(token=coze_api_token), base_url=coze_api_base)
+
+# Create a bot instance in Coze, copy the last number from the web link as the bot's ID.
+bot_id = os.getenv("COZE_BOT_ID") or "bot id"
+# The user id identifies the identity of a user. Developers can use a custom business ID
+# or a random string.
+user_id = "user id"
+
+
+async def chat(question: str) -> str:
+    # Call the coze.chat.stream method to create a chat. It returns an async iterator of
+    # chat events, the network wait of one stream does not block the others.
+    answer = ""
+    async for event in coze.chat.stream(
+        bot_id=bot_id,
+        user_id=user_id,
+        additional_messages=[
+            Message.build_user_question_text(question),
+        ],
+    ):
+        if event.event == ChatEventType.CONVERSATION_MESSAGE_DELTA:
+            answer += event.message.content
+
+        if event.event == ChatEventType.CONVERSATION_CHAT_COMPLETED:
+            print("token usage:", event.chat.usage.token_count)
+    return answer
+
+
+async def main() -> None:
+    questions = [
+        "Tell a 100-word story.",
+        "What is the capital of France?",
+        "Write a short poem about the sea.",
+    ]
+    # All streams share the client's connection pool and run on a single thread.
+    answers = await asyncio.gather(*[chat(question) for question in questions])
+    for question, answer in zip(questions, answers):
+        print(question)
+        print(answer)
+        print()
+
+
+asyncio.run(main())
@@ -1,9 +1,23 @@
 import base64
+import json
 
 import httpx
 import pytest
 
-from cozepy import AsyncCoze, Chat, ChatEvent, ChatEventType, ChatStatus, Coze, MessageObjectString, TokenAuth
+from cozepy import (
+    AsyncCoze,
+    Chat,
+    ChatEvent,
+    ChatEventType,
+    ChatStatus,
+    Coze,
+    CozeAPIError,
+    MessageContentType,
+    MessageObjectString,
+    TokenAuth,
+    dump_messages,
+    load_messages,
+)
 from cozepy.chat import ChatError, ChatUsage, Message
 from cozepy.util import random_hex, write_pcm_to_wav_file
 from tests.config import make_stream_response, read_file
@@ -64,6 +78,11 @@ event:error
 data:{}
         """)
 
+chat_error_code_stream_testdata = make_stream_response("""
+event:error
+data:{"code":4000,"msg":"invalid param"}
+        """)
+
 
 class TestMessageObjectString:
     def test_build_image(self):
@@ -79,6 +98,35 @@ class TestMessageObjectString:
             MessageObjectString.build_audio()
 
 
+class TestMessage:
+    def test_build_user_question_objects(self):
+        message = Message.build_user_question_objects(
+            [MessageObjectString.build_text("你好"), MessageObjectString.build_image(file_id="file_id")]
+        )
+
+        assert message.content_type == MessageContentType.OBJECT_STRING
+        assert json.loads(message.content) == [
+            {"type": "text", "text": "你好", "file_id": None, "file_url": None},
+            {"type": "image", "text": None, "file_id": "file_id", "file_url": None},
+        ]
+
+
+def test_dump_load_messages():
+    messages = [
+        Message.build_user_question_text("hi", meta_data={"k": "v"}),
+        Message.build_assistant_answer("hello"),
+    ]
+
+    data = dump_messages(messages)
+
+    assert json.loads(data) == [
+        {"role": "user", "type": "question", "content": "hi", "content_type": "text", "meta_data": {"k": "v"}},
+        {"role": "assistant", "type": "answer", "content": "hello", "content_type": "text"},
+    ]
+    assert load_messages(data) == messages
+    assert load_messages(data.decode("utf-8")) == messages
+
+
 @pytest.mark.respx(base_url="https://api.coze.com")
 class TestChat:
     def test_sync_chat_create(self, respx_mock):
@@ -93,6 +141,24 @@ class TestChat:
         assert res
         assert res.conversation_id == conversation_id
 
+    def test_sync_chat_create_additional_messages(self, respx_mock):
+        coze = Coze(auth=TokenAuth(token="token"))
+
+        route = respx_mock.post("/v3/chat").mock(
+            httpx.Response(200, json={"data": make_chat("conversation_id", ChatStatus.FAILED).model_dump()})
+        )
+        coze.chat.create(
+            bot_id="bot",
+            user_id="user",
+            additional_messages=[Message.build_user_question_text("hi"), Message.build_assistant_answer("hello")],
+        )
+
+        body = json.loads(route.calls.last.request.content)
+        assert [(i["role"], i["type"], i["content"], i["content_type"]) for i in body["additional_messages"]] == [
+            ("user", "question", "hi", "text"),
+            ("assistant", "answer", "hello", "text"),
+        ]
+
     def test_sync_chat_stream(self, respx_mock):
         coze = Coze(auth=TokenAuth(token="token"))
 
@@ -101,6 +167,7 @@ class TestChat:
 
         assert events
         assert len(events) == 9
+        assert all(isinstance(event.event, ChatEventType) for event in events)
         assert events[0] == ChatEvent(
             event=ChatEventType.CONVERSATION_CHAT_CREATED,
             chat=Chat(
@@ -148,8 +215,16 @@ class TestChat:
         coze = Coze(auth=TokenAuth(token="token"))
 
         respx_mock.post("/v3/chat").mock(chat_error_stream_testdata)
-        with pytest.raises(Exception, match="error event"):
+        with pytest.raises(CozeAPIError, match="error event"):
+            list(coze.chat.stream(bot_id="bot", user_id="user"))
+
+    def test_sync_chat_stream_error_code(self, respx_mock):
+        coze = Coze(auth=TokenAuth(token="token"))
+
+        respx_mock.post("/v3/chat").mock(chat_error_code_stream_testdata)
+        with pytest.raises(CozeAPIError, match="code: 4000, msg: invalid param") as e:
             list(coze.chat.stream(bot_id="bot", user_id="user"))
+        assert e.value.code == 4000
 
     def test_sync_chat_stream_failed(self, respx_mock):
         coze = Coze(auth=TokenAuth(token="token"))
@@ -338,7 +413,7 @@ event:error
 data:{}
         """)
         )
-        with pytest.raises(Exception, match="error event"):
+        with pytest.raises(CozeAPIError, match="error event"):
             async for event in coze.chat.stream(bot_id="bot", user_id="user"):
                 assert event
 
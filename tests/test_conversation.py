@@ -1,9 +1,10 @@
+import json
 import time
 
 import httpx
 import pytest
 
-from cozepy import AsyncCoze, Conversation, Coze, TokenAuth
+from cozepy import AsyncCoze, Conversation, Coze, Message, TokenAuth
 from cozepy.util import random_hex
 
 
@@ -24,6 +25,20 @@ class TestConversation:
         assert res.id == conversation.id
         assert res.last_section_id == conversation.last_section_id
 
+    def test_create_with_messages(self, respx_mock):
+        coze = Coze(auth=TokenAuth(token="token"))
+
+        conversation = make_conversation()
+        route = respx_mock.post("/v1/conversation/create").mock(
+            httpx.Response(200, json={"data": conversation.model_dump()})
+        )
+
+        coze.conversations.create(messages=[Message.build_user_question_text("hi")])
+        body = json.loads(route.calls.last.request.content)
+        assert body["messages"][0]["role"] == "user"
+        assert body["messages"][0]["content"] == "hi"
+        assert body["meta_data"] is None
+
     def test_conversations_retrieve(self, respx_mock):
         coze = Coze(auth=TokenAuth(token="token"))
 
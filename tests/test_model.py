@@ -3,7 +3,8 @@ from typing import Dict
 import pytest
 
 from cozepy import CozeInvalidEventError, Stream
-from cozepy.model import AsyncStream
+from cozepy.chat import ChatStatus
+from cozepy.model import AsyncStream, HTTPRequest
 from cozepy.util import anext
 
 from .test_util import to_async_iterator
@@ -17,7 +18,67 @@ async def mock_async_handler(d: Dict[str, str]):
     return d
 
 
+class TestHTTPRequest:
+    def test_as_httpx_json_body(self):
+        request = HTTPRequest(
+            method="POST",
+            url="https://api.coze.com/v3/chat",
+            headers={"Authorization": "Bearer token"},
+            json_body={"status": ChatStatus.COMPLETED, "meta_data": None},
+        ).as_httpx
+
+        assert request.headers["content-type"] == "application/json"
+        assert request.headers["authorization"] == "Bearer token"
+        assert request.read() == b'{"status":"completed","meta_data":null}'
+
+    def test_as_httpx_json_body_keep_content_type(self):
+        request = HTTPRequest(
+            method="POST",
+            url="https://api.coze.com/v3/chat",
+            headers={"content-type": "application/json; charset=utf-8"},
+            json_body={"bot_id": "bot"},
+        ).as_httpx
+
+        assert request.headers.get_list("content-type") == ["application/json; charset=utf-8"]
+
+    def test_as_httpx_files_and_body(self):
+        request = HTTPRequest(
+            method="POST",
+            url="https://api.coze.com/v1/audio/voices/clone",
+            json_body={"voice_name": "voice"},
+            files={"file": ("voice.mp3", b"audio")},
+        ).as_httpx
+
+        assert request.headers["content-type"].startswith("multipart/form-data")
+        content = request.read()
+        assert b'name="voice_name"' in content
+        assert b'filename="voice.mp3"' in content
+
+    def test_as_httpx_files_and_empty_body(self):
+        request = HTTPRequest(
+            method="POST",
+            url="https://api.coze.com/v1/files/upload",
+            json_body={},
+            files={"file": ("a.txt", b"data")},
+        ).as_httpx
+
+        assert request.headers["content-type"].startswith("multipart/form-data")
+        assert b'filename="a.txt"' in request.read()
+
+    def test_as_httpx_no_body(self):
+        request = HTTPRequest(method="GET", url="https://api.coze.com/v1/conversation/retrieve").as_httpx
+
+        assert "content-type" not in request.headers
+        assert request.read() == b""
+
+
 class TestStream:
+    def test_stream_fields(self):
+        items = ["", "event:message", 'data: {"time":"12:00"}']
+        s = Stream(iter(items), ["event", "data"], lambda d, logid: d, "mocked-logid")
+
+        assert next(s) == {"event": "message", "data": '{"time":"12:00"}'}
+
     def test_stream_invalid_event(self):
         items = ["event:x"]
         s = Stream(iter(items), ["field"], mock_sync_handler, "mocked-logid")
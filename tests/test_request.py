@@ -1,3 +1,5 @@
+import logging
+
 import httpx
 import pytest
 
@@ -15,6 +17,14 @@ class DebugModelForTest(CozeModel):
     data: str
 
 
+def test_make_request_debug_log_json_body(caplog):
+    caplog.set_level(logging.DEBUG, logger="cozepy")
+
+    Requester().make_request("post", "https://api.coze.com/api/test", json={"items": [ModelForTest(id="1")]})
+
+    assert 'json={"items":[{"id":"1"}]}' in caplog.text
+
+
 @pytest.mark.respx(base_url="https://api.coze.com")
 class TestRequester:
     def test_code_msg(self, respx_mock):